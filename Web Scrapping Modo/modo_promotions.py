@@ -7,7 +7,9 @@ DataFrame with detailed parameters for each promo.
 Usage
 -----
 links = fetch_promo_links()
-df    = build_promo_dataframe(links)
+df    = build_promo_dataframe(links)          # Selenium, pooled Chrome workers
+df    = build_promo_dataframe(links, parquet_path="promos.parquet")
+df    = build_promo_dataframe_http(links)     # aiohttp + parsel, no browser
 
 Columns returned
 ----------------
@@ -17,9 +19,25 @@ Columns returned
 """
 
 from __future__ import annotations
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import shelve
+import threading
 import time
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import wraps
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+from urllib.parse import urljoin, urlparse
+import lxml.html
 import pandas as pd
+import requests
+from tqdm import tqdm
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -27,87 +45,428 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver import ActionChains
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import (
+    NoSuchElementException, TimeoutException, StaleElementReferenceException,
+    WebDriverException, InvalidSessionIdException, NoSuchWindowException,
+)
 from webdriver_manager.chrome import ChromeDriverManager
 
+if TYPE_CHECKING:           # browser-free path only; imported lazily below
+    import aiohttp
+    from parsel import Selector
+
+logger = logging.getLogger(__name__)
+
+
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/125.0 Safari/537.36"
+    ),
+    "Accept-Language": "es-AR,es;q=0.9",
+}
+
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 1.  GRAB ALL PROMO LINKS
+# 0.  CHROME DRIVER
 # ─────────────────────────────────────────────────────────────────────────────
-def fetch_promo_links(
-    scroll_pause: int = 1,
-    max_stalls: int = 2,
-    headless: bool = True,
-) -> list[str]:
-    URL, BASE = "https://www.modo.com.ar/promos", "https://www.modo.com.ar"
-    CSS_TARGET = ".w-full.h-auto"                     # promo cards = <div>
+_CHROMEDRIVER_LOCK = threading.Lock()
+_chromedriver: str | None = None
+
+
+def _chromedriver_path() -> str:
+    """Resolve (downloading if needed) the chromedriver binary once per process."""
+    global _chromedriver
+    with _CHROMEDRIVER_LOCK:    # pool workers spawn concurrently
+        if _chromedriver is None:
+            _chromedriver = ChromeDriverManager().install()
+        return _chromedriver
+
+
+# we only read text and img src/alt, never the bytes behind them
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg", "*.mp4",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics*", "*googletagmanager*",
+]
+
+
+# subsystems a headless scraper never uses; skipping them speeds up start-up
+# and trims memory per driver
+CHROME_FLAGS = [
+    "--window-size=1920,1080",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=TranslateUI,MediaRouter,OptimizationHints",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+]
+
+
+# persistent profiles keep Chrome's HTTP/DNS cache and cookies between runs
+CHROME_PROFILE_DIR = Path.home() / ".cache" / "modo_scraper" / "chrome"
+CHROME_DISK_CACHE_BYTES = 256 * 1024 * 1024
+MAX_PROFILE_SLOTS = 16
+
+
+def _try_lock(path: Path) -> IO | None:
+    """Non-blocking exclusive lock on `path`; the OS drops it if we die."""
+    fh = open(path, "a+")
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        fh.close()
+        return None
+    return fh
+
+
+def _claim_profile(mode: str) -> tuple[Path | None, IO | None]:
+    """
+    Lock the first free persistent profile slot (`headless-0`, `headless-1`,
+    …).  Slots held by another run, or by a pool from a reloaded module, are
+    skipped; if all are taken return (None, None) and let Chrome use a
+    throw-away temporary profile.
+    """
+    CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    for slot in range(MAX_PROFILE_SLOTS):
+        lock = _try_lock(CHROME_PROFILE_DIR / f"{mode}-{slot}.lock")
+        if lock is not None:
+            return CHROME_PROFILE_DIR / f"{mode}-{slot}", lock
+    return None, None
 
+
+def _make_chrome_options(
+    headless: bool = True,
+    profile_dir: Path | None = None,
+) -> webdriver.ChromeOptions:
     opts = webdriver.ChromeOptions()
     if headless:
         opts.add_argument("--headless=new")
-    opts.add_argument("--window-size=1920,1080")
+    for flag in CHROME_FLAGS:
+        opts.add_argument(flag)
+    if profile_dir is not None:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        opts.add_argument(f"--user-data-dir={profile_dir}")
+        opts.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_BYTES}")
+    # return from driver.get() at DOMContentLoaded, not window.onload;
+    # callers wait for real content (and React hydration before interacting)
+    opts.page_load_strategy = "eager"
+    opts.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    return opts
 
+
+def _make_driver(
+    headless: bool = True,
+    profile_dir: Path | None = None,
+) -> webdriver.Chrome:
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()), options=opts
+        service=Service(_chromedriver_path()),
+        options=_make_chrome_options(headless, profile_dir),
     )
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except BaseException:
+        driver.quit()
+        raise
+    return driver
+
+
+class DriverPool:
+    """
+    Keeps up to `size` warm Chrome instances alive between calls, so
+    `fetch_promo_links` and `build_promo_dataframe` don't pay a cold start
+    every time.  Drivers are spawned lazily and quit on interpreter exit.
+    Each driver locks its own profile slot under CHROME_PROFILE_DIR (Chrome
+    allows one process per profile), so its disk cache survives across runs.
+    """
+
+    def __init__(self, size: int = 5, headless: bool = True):
+        self.size = size
+        self.headless = headless
+        self._idle: list[webdriver.Chrome] = []
+        self._drivers: list[webdriver.Chrome] = []
+        self._spawned = 0
+        self._profile_locks: dict[webdriver.Chrome, IO | None] = {}
+        # guards all of the above; notified whenever a driver comes back or
+        # a spawn slot frees up, so waiters in acquire() can re-check both
+        self._cond = threading.Condition()
+
+    def acquire(self) -> webdriver.Chrome:
+        with self._cond:
+            while not self._idle and self._spawned >= self.size:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._spawned += 1
+
+        profile_lock = None
+        try:
+            profile_dir, profile_lock = _claim_profile(
+                "headless" if self.headless else "headed"
+            )
+            driver = _make_driver(self.headless, profile_dir)
+        except BaseException:
+            if profile_lock is not None:
+                profile_lock.close()
+            with self._cond:
+                self._spawned -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._drivers.append(driver)
+            self._profile_locks[driver] = profile_lock
+        return driver
+
+    def release(self, driver: webdriver.Chrome, broken: bool = False) -> None:
+        """Hand `driver` back; a `broken` one is quit and its slot freed."""
+        with self._cond:
+            if not broken:
+                self._idle.append(driver)
+                self._cond.notify()
+                return
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self._spawned -= 1
+            profile_lock = self._profile_locks.pop(driver, None)
+            self._cond.notify()
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        if profile_lock is not None:
+            profile_lock.close()
 
+    def close(self) -> None:
+        with self._cond:
+            for driver in self._drivers:
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+            for profile_lock in self._profile_locks.values():
+                if profile_lock is not None:
+                    profile_lock.close()
+            self._drivers.clear()
+            self._profile_locks.clear()
+            self._spawned = 0
+            self._idle.clear()
+            self._cond.notify_all()
+
+
+def _is_driver_failure(exc: BaseException, driver: webdriver.Chrome) -> bool:
+    """
+    True if `exc` means the session behind `driver` is gone, not just that
+    the page misbehaved (click intercepted, element not interactable, ...).
+    Anything other than an explicit session loss is settled by a cheap
+    liveness probe, so a healthy warm driver is never thrown away.
+    """
+    if isinstance(exc, (InvalidSessionIdException, NoSuchWindowException)):
+        return True
     try:
-        driver.get(URL)
-        time.sleep(2)
+        driver.window_handles
+    except Exception:       # WebDriverException, or urllib3 if chromedriver died
+        return True
+    return False
 
-        helper = driver.find_element(
-            By.XPATH, "//h3[normalize-space()='¿Necesitás ayuda?']"
-        )
 
-        seen, stalls, last_y = set(), 0, -1
-        while stalls < max_stalls:
-            y_before = driver.execute_script("return window.pageYOffset")
-            driver.execute_script("window.scrollBy(0, window.innerHeight*0.8)")
-            time.sleep(0.3)
-            y_after = driver.execute_script("return window.pageYOffset")
+_POOLS: dict[bool, DriverPool] = {}
 
-            if y_after == y_before == last_y:
-                break            # absolute bottom
-            last_y = y_after
 
-            top = driver.execute_script(
-                "return arguments[0].getBoundingClientRect().top", helper
-            )
-            if 0 < top < driver.execute_script("return window.innerHeight") - 100:
-                time.sleep(scroll_pause)
-                for card in driver.find_elements(By.CSS_SELECTOR, CSS_TARGET):
-                    href = card.get_attribute("href")
-                    if href:
-                        seen.add(urljoin(BASE, href))
-                stalls = stalls + 1 if len(seen) == y_after else 0
-        return sorted(seen)
-    finally:
-        driver.quit()
+def get_driver_pool(headless: bool = True, size: int = 1) -> DriverPool:
+    """Shared pool for `headless`, grown to at least `size` drivers."""
+    if headless not in _POOLS:
+        _POOLS[headless] = DriverPool(size, headless)
+    pool = _POOLS[headless]
+    with pool._cond:
+        if size > pool.size:
+            pool.size = size
+            pool._cond.notify_all()     # waiters may spawn now
+    return pool
+
+
+@atexit.register
+def _close_driver_pools() -> None:
+    for pool in _POOLS.values():
+        pool.close()
+
+
+def retry_on_stale(tries: int = 3, delay: float = 0.05):
+    """
+    Re-run the decorated call when it hits StaleElementReferenceException.
+    The call must locate its elements itself (from a selector, not a handle
+    passed in) so every retry works on freshly located elements.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, tries + 1):
+                try:
+                    return fn(*args, **kwargs)
+                except StaleElementReferenceException:
+                    if attempt == tries:
+                        raise
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+# React tags every hydrated DOM node with __reactFiber$… / __reactProps$… keys
+_HYDRATED_JS = """
+const el = document.querySelector(arguments[0]);
+return !!el && Object.keys(el).some(
+  k => k.startsWith("__reactFiber$") || k.startsWith("__reactProps$"));
+"""
+
+
+def _wait_hydrated(driver, css: str, timeout: float = 5) -> None:
+    """
+    Best-effort wait until React has hydrated the first `css` match.  With the
+    eager page-load strategy the server-rendered DOM is there before any event
+    handlers (infinite scroll, “Ver listado”) are attached.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script(_HYDRATED_JS, css)
+        )
+    except TimeoutException:
+        logger.debug("no hydration signal for %r after %ss", css, timeout)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 2.  SCRAPE ONE PROMO PAGE
+# 1.  GRAB ALL PROMO LINKS
 # ─────────────────────────────────────────────────────────────────────────────
-def _parse_single_promo(driver, url):
+BASE_URL = "https://www.modo.com.ar"
+PROMOS_URL = BASE_URL + "/promos"
+
+# Paginated JSON endpoint behind the infinite-scroll list, formatted with a
+# 1-based page number, e.g. BASE_URL + "/api/promos?page={page}".  Left unset
+# until confirmed from the browser's Network tab; while it is None (or the
+# API fails or returns something unexpected) the list is scrolled with
+# Selenium instead.  Expected payload:
+# {"items": [{"slug_url": "/promos/..."}, ...]}, with an empty "items" list
+# past the last page.
+PROMOS_API_URL: str | None = None
+PROMOS_API_MAX_PAGES = 500
+
+
+def _fetch_promo_links_api() -> list[str] | None:
     """
-    Visit one promo URL and return a dict with all required fields.
-    Immune to StaleElementReferenceException caused by live re-renders.
+    Every promo URL from PROMOS_API_URL, page by page, or None on any HTTP or
+    payload problem (so the caller falls back to Selenium).  Stops on an empty
+    page, on a page that adds nothing new (API ignoring or clamping `page`),
+    or after PROMOS_API_MAX_PAGES.
     """
-    # ── local Selenium helpers ──────────────────────────────────────────
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver import ActionChains
-    from selenium.common.exceptions import (
-        NoSuchElementException, TimeoutException, StaleElementReferenceException
-    )
+    if not PROMOS_API_URL:
+        return None
+    seen: dict[str, None] = {}
+    with requests.Session() as session:
+        session.headers.update(HTTP_HEADERS)
+        for page in range(1, PROMOS_API_MAX_PAGES + 1):
+            try:
+                resp = session.get(PROMOS_API_URL.format(page=page), timeout=10)
+                resp.raise_for_status()
+                items = resp.json()["items"]
+                links = [urljoin(BASE_URL, it["slug_url"]) for it in items]
+            except (requests.RequestException, ValueError, KeyError, TypeError):
+                return None
+            n_before = len(seen)
+            seen.update(dict.fromkeys(links))
+            if len(seen) == n_before:
+                break
+        else:
+            logger.warning("promo API still paging after %d pages; stopping",
+                           PROMOS_API_MAX_PAGES)
+    return list(seen)
 
-    driver.get(url)
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.TAG_NAME, "body"))
+
+def fetch_promo_links(
+    scroll_pause: float = 1,
+    max_stalls: int = 2,
+    headless: bool = True,
+) -> list[str]:
+    """
+    Return every promo URL, in the order the cards appear on the page.
+    Uses the JSON API when PROMOS_API_URL is set, otherwise scrolls the
+    promo list to the end with Selenium.
+    `scroll_pause` is the longest we wait for new cards after each scroll.
+    """
+    links = _fetch_promo_links_api()
+    if links is not None:
+        return links
+
+    CSS_TARGET = ".w-full.h-auto"                     # promo cards = <div>
+    HEIGHT_JS = "return document.body.scrollHeight"
+    SCROLL_JS = (
+        "window.scrollBy({top: window.innerHeight*0.8, behavior: 'instant'});"
+        "return [window.pageYOffset, window.innerHeight, document.body.scrollHeight]"
     )
+    HREFS_JS = ("return Array.from(document.querySelectorAll(arguments[0]),"
+                " e => e.href || e.getAttribute('href'))")
+
+    pool = get_driver_pool(headless)
+    driver = pool.acquire()
+    broken = False
 
-    rec = {
+    try:
+        driver.get(PROMOS_URL)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, CSS_TARGET))
+        )
+        # the infinite-scroll observer only exists once the list is hydrated
+        _wait_hydrated(driver, CSS_TARGET)
+
+        seen: dict[str, None] = {}          # insertion-ordered set
+        stalls, last_y = 0, -1
+        prev_h = driver.execute_script(HEIGHT_JS)
+        while stalls < max_stalls:
+            prev_count = len(seen)
+            y, view_h, page_h = driver.execute_script(SCROLL_JS)
+
+            # a scroll that did not move is at the bottom too, but the next
+            # page may still be loading: treat it like any end-of-list scroll
+            # and let max_stalls decide when to give up
+            at_end = y == last_y or y + view_h >= page_h - 100
+            last_y = y
+
+            if at_end:
+                # end of the loaded list: wait for the next page to grow it
+                try:
+                    WebDriverWait(driver, scroll_pause, poll_frequency=0.05).until(
+                        lambda d: d.execute_script(HEIGHT_JS) > prev_h
+                    )
+                except TimeoutException:
+                    pass
+                prev_h = driver.execute_script(HEIGHT_JS)
+                hrefs = driver.execute_script(HREFS_JS, CSS_TARGET)
+                seen.update(dict.fromkeys(urljoin(BASE_URL, h) for h in hrefs if h))
+                # stall = a scroll at the end of the list that found no new cards
+                stalls = stalls + 1 if len(seen) == prev_count else 0
+        return list(seen)
+    except WebDriverException as exc:
+        broken = _is_driver_failure(exc, driver)
+        raise
+    finally:
+        pool.release(driver, broken)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2.  SCRAPE ONE PROMO PAGE
+# ─────────────────────────────────────────────────────────────────────────────
+def _empty_record(url: str) -> dict:
+    return {
         "link": url,
         "titulo": None, "foto": None, "subtitulo": None,
         "comercios": None, "store_names": None, "store_addresses": None,
@@ -115,151 +474,260 @@ def _parse_single_promo(driver, url):
         "tiempo_acreditacion": None, "dias": None, "canal": None,
     }
 
-    # ───────────────── headline ────────────────────────────────────────
-    for css in ("h1", "label.styles__TextCard-sc-25khzf-6"):
-        try:
-            rec["titulo"] = driver.find_element(By.CSS_SELECTOR, css).text.strip()
-            break
-        except NoSuchElementException:
-            pass
 
+_TITULO_SELECTORS = ("h1", "label.styles__TextCard-sc-25khzf-6")
+_FOTO_SELECTOR = "div.styles__ImageContainer-sc-25khzf-3 img"
+_SUBTITULO_SELECTORS = (
+    "h1 + p",
+    "h3.styles_new_description_sub_header__AEMry span",
+    "div.styles_container_sub_header__JpoUq",
+)
+_BLOCK_SELECTOR = (
+    "div.styles__ItemText-sc-25khzf-15,"
+    "div.styles__ItemSubContainer-sc-waujo0-9"
+)
+_LABEL_SELECTORS = ("span.styles_sub_item__s3Aiz", "p.text-caption-regular")
+_VALUE_SELECTORS = ("span.styles_sub_item_data__kKr1_", "p.text-body-medium")
+
+# lower-case + strip Spanish accents in one pass: "Días" → "dias"
+_FOLD = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZÁÉÍÓÚÜÑáéíóúüñ",
+    "abcdefghijklmnopqrstuvwxyzaeiouunaeiouun",
+)
+# label prefixes, or "usalo" anywhere in the label (it isn't always a prefix);
+# "usalo" is tried before "desde la" so "Desde la app, úsalo..." stays `dias`
+_LABEL_RE = re.compile(
+    r"(comercios|vigencia|bancos|tope|tiempo)|(?=.*?(usalo))|(desde la)", re.S
+)
+_LABEL_KEY_TO_FIELD = {
+    "comercios": "comercios",
+    "vigencia": "vigencia",
+    "bancos": "bancos",
+    "tope": "tope_reintegro",
+    "tiempo": "tiempo_acreditacion",
+    "usalo": "dias",
+    "desde la": "canal",
+}
+
+
+def _apply_block(rec: dict, label_txt: str, val: str,
+                 bancos: list[str], dias: list[str]) -> str | None:
+    """Store one label/value parameter block in `rec`; return the field set."""
+    m = _LABEL_RE.match(label_txt.translate(_FOLD))
+    field = _LABEL_KEY_TO_FIELD[m.group(m.lastindex)] if m else None
+
+    if field == "comercios":
+        rec[field] = val or None
+    elif field == "bancos":
+        rec[field] = bancos or None
+    elif field == "dias":
+        rec[field] = dias or None
+    elif field:
+        rec[field] = val
+    return field
+
+
+# Reads the whole promo page in-browser and returns it in one round-trip.
+_PROMO_JS = "(() => {\n  const SEL = %s;\n" % json.dumps({
+    "titulo": _TITULO_SELECTORS,
+    "foto": _FOTO_SELECTOR,
+    "subtitulo": _SUBTITULO_SELECTORS,
+    "block": _BLOCK_SELECTOR,
+    "label": _LABEL_SELECTORS,
+    "value": _VALUE_SELECTORS,
+}) + """
+  const text = el => el ? el.innerText.trim() : "";
+  const firstText = (root, sels) => {
+    for (const css of sels) {
+      const t = text(root.querySelector(css));
+      if (t) return t;
+    }
+    return "";
+  };
+  let titulo = null;
+  for (const css of SEL.titulo) {
+    const el = document.querySelector(css);
+    if (el) { titulo = text(el); break; }
+  }
+
+  const img = document.querySelector(SEL.foto);
+  const subtitulo = firstText(document, SEL.subtitulo) || null;
+
+  const blocks = Array.from(document.querySelectorAll(SEL.block), blk => {
+    const ps = blk.querySelectorAll("p");
+    const label = firstText(blk, SEL.label);
+    const value = firstText(blk, SEL.value) ||
+                  (ps.length >= 2 ? text(ps[1]) : "");
+    return {
+      label,
+      value,
+      bancos: Array.from(blk.querySelectorAll("img"),
+                         im => (im.getAttribute("alt") || "").trim()).filter(Boolean),
+      dias: Array.from(blk.querySelectorAll("span[aria-label]"))
+              .filter(sp => sp.getAttribute("aria-hidden") !== "true")
+              .map(sp => sp.getAttribute("aria-label")),
+      ver_listado: Array.from(ps).some(p => p.textContent.includes("Ver listado")),
+    };
+  });
+
+  return {titulo, foto: img ? img.src : null, subtitulo, blocks};
+})()"""
+
+# “Ver listado” inside the block whose label starts with “Comercios”.  Located
+# by content (never by a handle or an injected marker) so a retry after React
+# re-renders the block still finds the fresh node.
+_VER_LISTADO_XPATH = (
+    "//div[contains(@class, 'styles__ItemText-sc-25khzf-15')"
+    " or contains(@class, 'styles__ItemSubContainer-sc-waujo0-9')]"
+    "[.//*[(self::span and contains(@class, 'styles_sub_item__s3Aiz'))"
+    " or (self::p and contains(@class, 'text-caption-regular'))]"
+    "[starts-with(translate(normalize-space(.), 'COMERCIOS', 'comercios'),"
+    " 'comercios')]]"
+    "//p[contains(., 'Ver listado')]"
+)
+_STORES_SECTION = "section[data-testid='participating-stores-list']"
+_STORE_NAME_XPATH = ".//p[@data-testid='store-name']"
+_STORE_ADDRESS_XPATH = ".//p[@data-testid='store-address']"
+_BANCOS_XPATH = ".//img/@alt"
+_DIAS_XPATH = ".//span[@aria-label and not(@aria-hidden='true')]/@aria-label"
+
+
+def _subtree(elem) -> lxml.html.HtmlElement:
+    """Snapshot `elem` as an lxml tree: one round-trip, and it can't go stale."""
+    return lxml.html.fromstring(elem.get_attribute("outerHTML"))
+
+
+# JSON endpoint behind the “Ver listado” modal, formatted with the promo
+# slug, e.g. "https://www.modo.com.ar/api/promos/{promo_id}/stores".  Left
+# unset until confirmed from the browser's Network tab; while it is None the
+# scraper clicks through the modal instead.  Expected payload: a list of
+# {"name": ..., "address": ...} objects, optionally wrapped in {"stores": [...]}.
+STORES_API_URL: str | None = None
+
+
+def _fetch_stores_api(driver, url: str) -> tuple[list[str], list[str]] | None:
+    """
+    Store names + addresses straight from STORES_API_URL, or None on any
+    HTTP error or unexpected payload (so the caller clicks the modal instead).
+    """
+    if not STORES_API_URL:
+        return None
+    promo_id = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+    cookies = {c["name"]: c["value"] for c in driver.get_cookies()}
     try:
-        rec["foto"] = driver.find_element(
-            By.CSS_SELECTOR, "div.styles__ImageContainer-sc-25khzf-3 img"
-        ).get_attribute("src")
-    except NoSuchElementException:
-        pass
-
-    for css in ("h1 + p",
-                "h3.styles_new_description_sub_header__AEMry span",
-                "div.styles_container_sub_header__JpoUq"):
-        try:
-            t = driver.find_element(By.CSS_SELECTOR, css).text.strip()
-            if t:
-                rec["subtitulo"] = t
-                break
-        except NoSuchElementException:
-            continue
-
-    # ───────────────── parameter blocks ────────────────────────────────
-    comercios_btn = None
-    blocks = driver.find_elements(
-        By.CSS_SELECTOR,
-        "div.styles__ItemText-sc-25khzf-15,"
-        "div.styles__ItemSubContainer-sc-waujo0-9"
+        resp = requests.get(
+            STORES_API_URL.format(promo_id=promo_id),
+            headers=HTTP_HEADERS, cookies=cookies, timeout=10,
+        )
+        resp.raise_for_status()
+        payload = resp.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    stores = payload.get("stores") if isinstance(payload, dict) else payload
+    if not isinstance(stores, list) \
+            or not all(isinstance(st, dict) for st in stores):
+        return None
+    names = [str(st.get("name") or "").strip() for st in stores]
+    addrs = [str(st.get("address") or "").strip() for st in stores]
+    return names, addrs
+
+
+@retry_on_stale()
+def _open_stores_modal(driver) -> None:
+    """Click “Ver listado” (re-located on every try) and wait for the list."""
+    btn = driver.find_element(By.XPATH, _VER_LISTADO_XPATH)
+    ActionChains(driver).move_to_element(btn).click().perform()
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, _STORES_SECTION))
     )
 
-    def _safe_text(elem, selector) -> str:
-        """return .text of `elem.find_element(selector)` or ''"""
-        try:
-            return elem.find_element(By.CSS_SELECTOR, selector).text.strip()
-        except NoSuchElementException:
-            return ""
-
-    for blk in blocks:
-        # label (two possible classes)
-        label_txt = _safe_text(blk, "span.styles_sub_item__s3Aiz") or \
-                    _safe_text(blk, "p.text-caption-regular")
-        if not label_txt:
-            continue
-        label = label_txt.lower()
 
-        # value text (three fall-backs)
-        val = _safe_text(blk, "span.styles_sub_item_data__kKr1_") or \
-              _safe_text(blk, "p.text-body-medium")
-        if not val:
-            ps = blk.find_elements(By.TAG_NAME, "p")
-            val = ps[1].text.strip() if len(ps) >= 2 else ""
+@retry_on_stale()
+def _read_stores(driver) -> tuple[list[str], list[str]]:
+    """Store names + addresses from the open modal, in a single round-trip."""
+    sec = _subtree(driver.find_element(By.CSS_SELECTOR, _STORES_SECTION))
+    names = [p.text_content().strip() for p in sec.xpath(_STORE_NAME_XPATH)]
+    addrs = [p.text_content().strip() for p in sec.xpath(_STORE_ADDRESS_XPATH)]
+    return names, addrs
 
-        # ——— Comercios ————————————————————————————
-        if label.startswith("comercios"):
-            rec["comercios"] = val or None
-            if val.lower().startswith("ver listado"):
-                try:
-                    comercios_btn = blk.find_element(
-                        By.XPATH, ".//p[contains(.,'Ver listado')]"
-                    )
-                except NoSuchElementException:
-                    comercios_btn = None
 
-        # ——— Vigencia ————————————————————————————
-        elif label.startswith("vigencia"):
-            rec["vigencia"] = val
+def _read_promo_page(driver) -> dict:
+    """
+    Evaluate `_PROMO_JS` through CDP `Runtime.evaluate` with `returnByValue`,
+    falling back to the classic `execute_script` path if CDP reports an error.
+    """
+    try:
+        res = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": _PROMO_JS,
+            "returnByValue": True,
+            "awaitPromise": False,
+        })
+    except WebDriverException:
+        res = {}
+    result = res.get("result", {})
+    if "exceptionDetails" in res or result.get("subtype") == "error" \
+            or "value" not in result:
+        return driver.execute_script("return " + _PROMO_JS)
+    return result["value"]
 
-        # ——— Bancos ——————————————————————————————
-        elif label.startswith("bancos"):
-            alts = []
-            for img in blk.find_elements(By.TAG_NAME, "img"):
-                try:
-                    alt = img.get_attribute("alt")
-                    if alt:
-                        alts.append(alt.strip())
-                except StaleElementReferenceException:
-                    continue
-            rec["bancos"] = alts or None
 
-        # ——— Tope de reintegro ————————————————
-        elif label.startswith("tope"):
-            rec["tope_reintegro"] = val
+def _parse_single_promo(driver, url):
+    """
+    Visit one promo URL and return a dict with all required fields.
+    The page is read in one round-trip (`_read_promo_page`, via CDP
+    `Runtime.evaluate`), so there are no element handles that can go stale
+    halfway through.
+    """
+    driver.get(url)
+    # under the eager strategy <body> exists immediately; wait for content
+    WebDriverWait(driver, 10).until(EC.any_of(
+        EC.presence_of_element_located((By.CSS_SELECTOR, _BLOCK_SELECTOR)),
+        EC.presence_of_element_located((By.TAG_NAME, "h1")),
+    ))
 
-        # ——— Tiempo de acreditación ————————————
-        elif label.startswith("tiempo"):
-            rec["tiempo_acreditacion"] = val
+    rec = _empty_record(url)
+    page = _read_promo_page(driver)
 
-        # ——— Días (robust loop) ————————————————
-        elif "usalo" in label:
-            active = []
-            for sp in blk.find_elements(By.CSS_SELECTOR, "span[aria-label]"):
-                try:
-                    if sp.get_attribute("aria-hidden") != "true":
-                        active.append(sp.get_attribute("aria-label"))
-                except StaleElementReferenceException:
-                    continue
-            rec["dias"] = active or None
+    # ───────────────── headline ────────────────────────────────────────
+    rec["titulo"] = page["titulo"]
+    rec["foto"] = page["foto"]
+    rec["subtitulo"] = page["subtitulo"]
 
-        # ——— Canal ————————————————————————————
-        elif label.startswith("desde la"):
-            rec["canal"] = val
+    # ───────────────── parameter blocks ────────────────────────────────
+    has_ver_listado = False
+    for blk in page["blocks"]:
+        if not blk["label"]:
+            continue
+        field = _apply_block(rec, blk["label"], blk["value"],
+                             blk["bancos"], blk["dias"])
+        if field == "comercios":
+            has_ver_listado = blk["ver_listado"] \
+                and blk["value"].lower().startswith("ver listado")
 
     # ───── optional “Ver listado” modal (safe) ───────────────────────────
-    if (rec.get("comercios") or "").lower().startswith("ver listado") and comercios_btn:
+    if has_ver_listado:
         try:
-            ActionChains(driver).move_to_element(comercios_btn).click().perform()
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR,
-                     "section[data-testid='participating-stores-list']")
-                )
-            )
-            sec = driver.find_element(
-                By.CSS_SELECTOR, "section[data-testid='participating-stores-list']"
-            )
-            # store names
-            names, addrs = [], []
-            for p in sec.find_elements(By.CSS_SELECTOR,
-                                       "p[data-testid='store-name']"):
-                try:
-                    names.append(p.text.strip())
-                except StaleElementReferenceException:
-                    continue
-            for p in sec.find_elements(By.CSS_SELECTOR,
-                                       "p[data-testid='store-address']"):
+            stores = _fetch_stores_api(driver, url)
+            if stores is None:
+                _wait_hydrated(driver, _BLOCK_SELECTOR)   # click needs handlers
+                _open_stores_modal(driver)
+                stores = _read_stores(driver)
+                # close modal
                 try:
-                    addrs.append(p.text.strip())
-                except StaleElementReferenceException:
-                    continue
+                    driver.find_element(
+                        By.CSS_SELECTOR,
+                        "button[data-testid='button-modal-close']"
+                    ).click()
+                except NoSuchElementException:
+                    pass
+            names, addrs = stores
             rec["store_names"] = names or None
             rec["store_addresses"] = addrs or None
-            # close modal
-            try:
-                driver.find_element(
-                    By.CSS_SELECTOR,
-                    "button[data-testid='button-modal-close']"
-                ).click()
-            except NoSuchElementException:
-                pass
-        except (TimeoutException, StaleElementReferenceException):
-            pass
+        except WebDriverException as exc:
+            # the modal is optional: a blocked click or a stale list must not
+            # cost the fields already parsed above
+            logger.warning("stores not read for %s (%s)", url, exc)
 
     return rec
 
@@ -267,29 +735,258 @@ def _parse_single_promo(driver, url):
 # ─────────────────────────────────────────────────────────────────────────────
 # 3.  BUILD DATAFRAME FOR MANY PROMOS
 # ─────────────────────────────────────────────────────────────────────────────
-def build_promo_dataframe(urls: list[str], headless: bool = True) -> pd.DataFrame:
-    opts = webdriver.ChromeOptions()
-    if headless:
-        opts.add_argument("--headless=new")
-    opts.add_argument("--window-size=1920,1080")
+PARQUET_BATCH_SIZE = 64
+LIST_COLUMNS = ("store_names", "store_addresses", "bancos", "dias")
 
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()), options=opts
+
+def _promo_schema():
+    """Arrow schema of a promo record (pyarrow is only needed for Parquet)."""
+    import pyarrow as pa
+
+    return pa.schema([
+        (col, pa.list_(pa.string()) if col in LIST_COLUMNS else pa.string())
+        for col in _empty_record("")
+    ])
+
+
+def build_promo_dataframe(
+    urls: list[str],
+    headless: bool = True,
+    max_concurrency: int = 5,
+    parquet_path: str | None = None,
+) -> pd.DataFrame:
+    """
+    Scrape `urls` with up to `max_concurrency` pooled Chrome instances in
+    parallel.  Rows come back in the same order as `urls`.
+
+    With `parquet_path`, rows are streamed to that file in batches of
+    PARQUET_BATCH_SIZE instead of being held in memory until the end; the
+    DataFrame is then read back from the file.
+    """
+    n_workers = max(1, min(max_concurrency, len(urls)))
+    pool = get_driver_pool(headless, n_workers)
+
+    def _worker(url: str) -> dict:
+        driver = pool.acquire()
+        broken = False
+        try:
+            return _parse_single_promo(driver, url)
+        except Exception as exc:    # one bad page must not sink the whole run
+            broken = _is_driver_failure(exc, driver)
+            logger.warning("failed %s (%s)", url, exc)
+            return _empty_record(url)
+        finally:
+            pool.release(driver, broken)
+
+    writer = None
+    if parquet_path:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = _promo_schema()
+        writer = pq.ParquetWriter(parquet_path, schema)
+    pending: dict[int, dict] = {}       # finished out of order, not yet emitted
+    batch: list[dict] = []
+    next_i = 0
+    try:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = {executor.submit(_worker, u): i for i, u in enumerate(urls)}
+            progress = tqdm(as_completed(futures), total=len(urls),
+                            desc="promos", unit="promo", mininterval=0.5)
+            try:
+                for fut in progress:
+                    i = futures[fut]
+                    logger.debug("scraped %s", urls[i])
+                    pending[i] = fut.result()
+                    while next_i in pending:
+                        batch.append(pending.pop(next_i))
+                        next_i += 1
+                    if writer and len(batch) >= PARQUET_BATCH_SIZE:
+                        writer.write_batch(
+                            pa.RecordBatch.from_pylist(batch, schema=schema)
+                        )
+                        batch = []
+            except BaseException:
+                # don't keep scraping queued URLs whose results we'd discard
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        if writer is None:
+            return pd.DataFrame(batch)
+        if batch:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+    finally:
+        if writer:
+            writer.close()
+
+    df = pd.read_parquet(parquet_path)
+    # Parquet hands list cells back as numpy arrays; match the in-memory path
+    for col in LIST_COLUMNS:
+        df[col] = df[col].map(lambda v: None if v is None else list(v))
+    return df
+
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 4.  SCRAPE PROMO PAGES WITHOUT A BROWSER
+# ─────────────────────────────────────────────────────────────────────────────
+def _node_text(node) -> str:
+    """parsel equivalent of Selenium's `.text`"""
+    return " ".join(
+        t.strip() for t in node.xpath(".//text()").getall() if t.strip()
     )
 
+
+def _css_text(node: Selector, css: str) -> str:
+    """`_node_text` of the first match of `css` inside `node`, or ''"""
+    return _node_text(node.css(css)[:1])
+
+
+def _parse_promo_html(html: str, url: str) -> dict:
+    """
+    Parse the server-rendered HTML of one promo page into the same dict
+    `_parse_single_promo` returns.  The store lists only exist inside the
+    "Ver listado" modal, so `store_names` / `store_addresses` stay None.
+    """
+    from parsel import Selector
+
+    sel = Selector(text=html)
+    rec = _empty_record(url)
+
+    # ───────────────── headline ────────────────────────────────────────
+    for css in _TITULO_SELECTORS:
+        if sel.css(css):
+            rec["titulo"] = _css_text(sel, css)
+            break
+
+    foto = sel.css(_FOTO_SELECTOR + "::attr(src)").get()
+    rec["foto"] = urljoin(url, foto) if foto else None     # absolute, like img.src
+
+    for css in _SUBTITULO_SELECTORS:
+        t = _css_text(sel, css)
+        if t:
+            rec["subtitulo"] = t
+            break
+
+    # ───────────────── parameter blocks ────────────────────────────────
+    for blk in sel.css(_BLOCK_SELECTOR):
+        label_txt = next(filter(None, (_css_text(blk, c) for c in _LABEL_SELECTORS)), "")
+        if not label_txt:
+            continue
+
+        val = next(filter(None, (_css_text(blk, c) for c in _VALUE_SELECTORS)), "")
+        if not val:
+            ps = blk.css("p")
+            val = _node_text(ps[1]) if len(ps) >= 2 else ""
+
+        bancos = [a.strip() for a in blk.xpath(_BANCOS_XPATH).getall()
+                  if a.strip()]
+        dias = blk.xpath(_DIAS_XPATH).getall()
+        _apply_block(rec, label_txt, val, bancos, dias)
+
+    return rec
+
+
+# Bump whenever the parse changes (selectors, _apply_block, record fields):
+# entries written by another version are ignored and the page is reparsed.
+CACHE_VERSION = 1
+
+
+def _cache_key(url: str) -> str:
+    return hashlib.sha1(url.encode()).hexdigest()
+
+
+async def _fetch_single_promo(session: aiohttp.ClientSession,
+                              sem: asyncio.Semaphore, url: str,
+                              cache: shelve.Shelf | None = None) -> dict:
+    """
+    GET one promo page and parse it.  With a `cache`, the request is made
+    conditional on the stored ETag / Last-Modified, and a 304 (or a body
+    whose sha256 hasn't changed) returns the cached record without parsing.
+    """
+    import aiohttp
+
+    key = _cache_key(url)
+    entry = cache.get(key) if cache is not None else None
+    if entry and entry.get("version") != CACHE_VERSION:
+        entry = None
+    headers = {}
+    if entry:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    async with sem:
+        try:
+            async with session.get(url, headers=headers) as resp:
+                if resp.status == 304 and entry:
+                    return dict(entry["rec"])
+                resp.raise_for_status()
+                body = await resp.read()
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+                charset = resp.charset or "utf-8"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            logger.warning("skipping %s (%s)", url, exc)
+            return _empty_record(url)
+
+    body_hash = hashlib.sha256(body).hexdigest()
+    if entry and entry["body_hash"] == body_hash:
+        rec = dict(entry["rec"])
+    else:
+        rec = _parse_promo_html(body.decode(charset, errors="replace"), url)
+
+    if cache is not None:
+        cache[key] = {
+            "version": CACHE_VERSION,
+            "etag": etag, "last_modified": last_modified,
+            "body_hash": body_hash, "rec": rec,
+        }
+    return rec
+
+
+async def fetch_promo_details(urls: list[str],
+                              max_concurrency: int = 10,
+                              cache_path: str | None = None) -> list[dict]:
+    """
+    Download and parse every promo page concurrently (bounded).
+    Pass `cache_path` to keep a validator cache on disk between runs.
+    """
+    import aiohttp
+
+    sem = asyncio.Semaphore(max_concurrency)
+    timeout = aiohttp.ClientTimeout(total=30)
+    cache = shelve.open(cache_path) if cache_path else None
     try:
-        recs = []
-        for i, u in enumerate(urls, 1):
-            print(f"[{i}/{len(urls)}]  {u}")
-            recs.append(_parse_single_promo(driver, u))
-        return pd.DataFrame(recs)
+        async with aiohttp.ClientSession(headers=HTTP_HEADERS,
+                                         timeout=timeout) as session:
+            return await asyncio.gather(
+                *(_fetch_single_promo(session, sem, u, cache) for u in urls)
+            )
     finally:
-        driver.quit()
+        if cache is not None:
+            cache.close()
+
 
+def build_promo_dataframe_http(urls: list[str],
+                               max_concurrency: int = 10,
+                               cache_path: str | None = None) -> pd.DataFrame:
+    """
+    Synchronous wrapper around `fetch_promo_details`.  Inside a running event
+    loop (e.g. a Jupyter notebook) asyncio.run() is not allowed, so the
+    coroutine is run on its own loop in a worker thread instead.
+    """
+    coro = fetch_promo_details(urls, max_concurrency, cache_path)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:                # no loop here: the plain script case
+        return pd.DataFrame(asyncio.run(coro))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return pd.DataFrame(executor.submit(asyncio.run, coro).result())
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 4.  DEMO
+# 5.  DEMO
 # ─────────────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     links = fetch_promo_links()